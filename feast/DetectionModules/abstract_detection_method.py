@@ -13,13 +13,15 @@ class DetectionMethod:
     """
 
     def __init__(self, time, detection_variables=None, op_envelope=None, ophrs=None, dispatch_threshold=None,
-                 sensitivity=None):
+                 sensitivity=None, seed=None):
         """
         :param time: a Time object
         :param detection_variables: dict of variables used in probability of detection calculations with the name of
             the variable followed by interpolation method (eg. {'flux': 'mean', 'wind speed': max})
         :param op_envelope: operating envelope specifications for the detection method
         :param ophrs: a dict specifying operating hours for the DetectionMethod
+        :param seed: seed for a dedicated numpy Generator (PCG64) used to draw detection scores. If None, scores are
+            drawn from the global numpy random state so that np.random.seed controls the whole simulation.
         """
         self.op_envelope = op_envelope or {}
         self.ophrs = ophrs or {}
@@ -32,6 +34,7 @@ class DetectionMethod:
         self.detection_count = rc.ResultDiscrete(units='Count')
         self.dispatch_threshold = dispatch_threshold
         self.sensitivity = sensitivity
+        self.rng = None if seed is None else np.random.default_rng(seed)
         if type(self.detection_variables) is not dict:
             raise TypeError("Detection_variables must be a dict of form {name: interpolation mode,}")
 
@@ -42,11 +45,22 @@ class DetectionMethod:
         :param time: A Time object
         :return: True if check_time passes, False otherwise
         """
-        oktime = self.ophrs['begin'] <= np.mod(time.current_time, 1) * 24 < self.ophrs['end']
+        oktime = self.ophrs['begin'] <= time.current_time % 1 * 24 < self.ophrs['end']
         # accounts for a delta_t that is greater than the daily working hours
         timesize = time.delta_t * 24 > self.ophrs['end'] - self.ophrs['begin']
         return oktime or timesize
 
+    def draw_scores(self, n_scores):
+        """
+        Draws the uniform random scores that are compared to probabilities of detection
+
+        :param n_scores: the number of scores to draw
+        :return: an array of n_scores values between 0 and 1
+        """
+        if self.rng is None:
+            return np.random.uniform(0, 1, n_scores)
+        return self.rng.random(n_scores)
+
     def check_op_envelope(self, gas_field, time, site_index=None):
         """
         Returns the status of the operating envelope. The method supports 8 types of operating envelope conditions:
@@ -216,13 +230,43 @@ class DetectionMethod:
         """
         conditions = np.zeros([len(em_id), len(self.detection_variables)])
 
-        index = 0
-        for v, im in self.detection_variables.items():
+        for index, (v, im) in enumerate(self.detection_variables.items()):
             if v in gas_field.met:
                 conditions[:, index] = gas_field.get_met(time, v, interp_modes=im, ophrs=self.ophrs)[v]
             else:
                 conditions[:, index] = emissions[v][em_id]
-            index += 1
+        return conditions
+
+    def get_site_conditions(self, time, gas_field, emissions, site_inds):
+        """
+        Extracts conditions specified in self.detection_variables for every site in site_inds. Emission variables are
+        summed across all emissions at each site.
+
+        :param time: a Time object
+        :param gas_field: a GasField object
+        :param emissions: a DataFrame of current emissions
+        :param site_inds: site indexes to consider
+        :return conditions: an array (n_sites, n_variables) of conditions for use in the PoD calculation
+        """
+        conditions = np.zeros([len(site_inds), len(self.detection_variables)])
+        # Sort emissions by site once so that the emissions at each site occupy a contiguous block [start, end)
+        site_index = emissions.site_index.to_numpy()
+        if np.all(site_index[:-1] <= site_index[1:]):
+            # Emissions that are already ordered by site can be searched directly
+            order = slice(None)
+        else:
+            order = np.argsort(site_index, kind='stable')
+        start = np.searchsorted(site_index[order], site_inds, side='left')
+        end = np.searchsorted(site_index[order], site_inds, side='right')
+        bounds = np.ravel(np.column_stack((start, end)))
+        for index, (v, im) in enumerate(self.detection_variables.items()):
+            if v in gas_field.met:
+                conditions[:, index] = gas_field.get_met(time, v, interp_modes=im, ophrs=self.ophrs)[v]
+            else:
+                # reduceat sums each block at the even positions of bounds. The appended 0 allows end == len(order).
+                values = np.append(emissions[v].to_numpy()[order], 0)
+                conditions[:, index] = np.add.reduceat(values, bounds)[::2]
+                conditions[start == end, index] = 0
         return conditions
 
     @staticmethod
@@ -236,13 +280,7 @@ class DetectionMethod:
             and k is the number of conditions
         :return: an array of the probabilities of detection (dimension N)
         """
-        probs = interp.griddata(test_conditions, test_results, sim_conditions)
-        # griddata returns NaN for vars outside the convex hull of the interpolation data points when using default
-        # linear interpolation. The following code sets those NaN values (outside the convex hull)
-        # to the nearest interpolation point.
-        cond = np.where(np.isnan(probs))[0]
-        probs[cond] = interp.griddata(test_conditions, test_results, sim_conditions[cond], method='nearest')
-        return np.ndarray.flatten(probs)
+        return EmpiricalInterpolator(test_conditions, test_results)(sim_conditions)
 
     def extend_site_queue(self, site_inds):
         """
@@ -251,9 +289,12 @@ class DetectionMethod:
         :param site_inds: List of indexes to add to the queue
         :return: None
         """
+        # a set gives constant time membership checks when many sites are added to a long queue
+        queued = set(self.site_queue)
         for si in site_inds:
-            if si not in self.site_queue:
+            if si not in queued:
                 self.site_queue.append(si)
+                queued.add(si)
 
     def flux_val(self, flux):
         """
@@ -305,3 +346,72 @@ class DetectionMethod:
             return thresh_eIDs, permiss_emiss
         else:
             raise Exception('this survey type not yet supported')
+
+
+class EmpiricalInterpolator:
+    """
+    EmpiricalInterpolator interpolates linearly between empirical test results and uses the nearest test result for
+    conditions outside the range of the tests. The interpolation objects are built once so that they can be reused
+    every time step without repeating the triangulation.
+    """
+    def __init__(self, test_conditions, test_results):
+        """
+        :param test_conditions: conditions to be interpolated from (array of shape N or NxM, where N is the number of
+            distinct conditions and M is the number of variables)
+        :param test_results: results associated with each condition listed in test_conditions (array of shape N)
+        """
+        # scipy interpolators work on contiguous float64 arrays. Converting once here avoids a separate copy of the
+        # test data for each interpolation object built below.
+        test_conditions = np.ascontiguousarray(test_conditions, dtype=float)
+        test_results = np.ascontiguousarray(test_results, dtype=float)
+        self.n_variables = 1 if test_conditions.ndim < 2 else test_conditions.shape[-1]
+        if self.n_variables == 1:
+            # One dimensional conditions are interpolated with interp1d, which requires sorted conditions
+            test_conditions = np.ndarray.flatten(test_conditions)
+            order = np.argsort(test_conditions)
+            self.linear = interp.interp1d(test_conditions[order], test_results[order], bounds_error=False,
+                                          fill_value=np.nan)
+            self.nearest = interp.interp1d(test_conditions[order], test_results[order], kind='nearest',
+                                           bounds_error=False, fill_value='extrapolate')
+        else:
+            self.linear = self.regular_grid_interpolator(test_conditions, test_results) or \
+                          interp.LinearNDInterpolator(test_conditions, test_results)
+            self.nearest = interp.NearestNDInterpolator(test_conditions, test_results)
+
+    @staticmethod
+    def regular_grid_interpolator(test_conditions, test_results):
+        """
+        Test conditions are often measured on a regular grid (every combination of a set of values for each variable).
+        In that case the conditions can be interpolated directly on the grid rather than through a triangulation.
+
+        :param test_conditions: NxM array of conditions to be interpolated from
+        :param test_results: results associated with each condition listed in test_conditions
+        :return: a RegularGridInterpolator if test_conditions form a complete regular grid, None otherwise
+        """
+        axes = [np.unique(test_conditions[:, ind]) for ind in range(test_conditions.shape[1])]
+        shape = [len(axis) for axis in axes]
+        if min(shape) < 2 or np.prod(shape) != len(test_conditions):
+            return None
+        grid_inds = tuple(np.searchsorted(axes[ind], test_conditions[:, ind]) for ind in range(len(axes)))
+        filled = np.zeros(shape, dtype=bool)
+        filled[grid_inds] = True
+        # Duplicate conditions leave some grid points without a result
+        if not filled.all():
+            return None
+        grid = np.zeros(shape)
+        grid[grid_inds] = test_results
+        return interp.RegularGridInterpolator(axes, grid, bounds_error=False, fill_value=np.nan)
+
+    def __call__(self, sim_conditions):
+        """
+        :param sim_conditions: Nxk array of current conditions, where N is the number of emissions to consider,
+            and k is the number of conditions
+        :return: an array of the interpolated results (dimension N)
+        """
+        sim_conditions = np.reshape(sim_conditions, (-1, self.n_variables))
+        probs = self.linear(sim_conditions)
+        # Linear interpolation returns NaN for vars outside the convex hull of the interpolation data points.
+        # The following code sets those NaN values (outside the convex hull) to the nearest interpolation point.
+        cond = np.where(np.isnan(probs))[0]
+        probs[cond] = self.nearest(sim_conditions[cond])
+        return np.ndarray.flatten(probs)
@@ -60,7 +60,7 @@ class CompSurvey(DetectionMethod):
 
         # -------------- Set calculated parameters --------------
         work_time = (self.ophrs['end'] - self.ophrs['begin']) / 24
-        self.comps_per_timestep = self.survey_speed * 24 * time.delta_t * np.min([1, work_time / time.delta_t])
+        self.comps_per_timestep = self.survey_speed * 24 * time.delta_t * min(1, work_time / time.delta_t)
 
     def detect_prob_curve(self, time, gas_field, em_surveyed, emissions):
         """
@@ -76,7 +76,7 @@ class CompSurvey(DetectionMethod):
         n_scores = len(em_surveyed)
         if n_scores == 0:
             return em_surveyed
-        scores = np.random.uniform(0, 1, n_scores)
+        scores = self.draw_scores(n_scores)
         vals = self.get_current_conditions(time, gas_field, emissions, em_surveyed)
         probs = self.empirical_interpolator(self.detection_probability_points, self.detection_probabilities, vals)
         detect = em_surveyed[scores <= probs]
@@ -97,6 +97,10 @@ class CompSurvey(DetectionMethod):
         # only considering nonzero leaks is important because cleaning leaks that have been set to 0 from the leak
         # set happens periodically in the simulation and would otherwise cause indexing errors
         emitter_inds = []
+        # Emission properties do not change while sites are surveyed, so they are extracted as arrays once
+        em_site_index = emissions.site_index.to_numpy()
+        em_comp_index = emissions.comp_index.to_numpy()
+        em_index = emissions.index.to_numpy()
         while remaining_comps > 0:
             if (time.current_time - self.mid_site_fail_time) > self.op_env_wait_time:
                 # if the survey has been stuck part way through a site for op_env_wait_time due to operating envelope
@@ -121,13 +125,14 @@ class CompSurvey(DetectionMethod):
             # site_name is used to flag all sites with the same properties
             # One site name can refer to multiple sites
             site_name = self.find_site_name(gas_field, self.site_survey_index)
-            site_cond = emissions.site_index == self.site_survey_index
-            comp_cond = (emissions.comp_index >= self.comp_survey_index) & \
-                        (emissions.comp_index < self.comp_survey_index + remaining_comps)
-            emitter_inds.extend(emissions.index[site_cond & comp_cond])
-            if remaining_comps + self.comp_survey_index > gas_field.sites[site_name]['parameters'].max_comp_ind:
-                remaining_comps -= (gas_field.sites[site_name]['parameters'].max_comp_ind - self.comp_survey_index)
-                n_comps = gas_field.sites[site_name]['parameters'].max_comp_ind - self.comp_survey_index
+            site_cond = em_site_index == self.site_survey_index
+            comp_cond = (em_comp_index >= self.comp_survey_index) & \
+                        (em_comp_index < self.comp_survey_index + remaining_comps)
+            emitter_inds.extend(em_index[site_cond & comp_cond])
+            max_comp_ind = gas_field.sites[site_name]['parameters'].max_comp_ind
+            if remaining_comps + self.comp_survey_index > max_comp_ind:
+                remaining_comps -= (max_comp_ind - self.comp_survey_index)
+                n_comps = max_comp_ind - self.comp_survey_index
                 self.comp_survey_index = 0
                 self.deployment_cost.append_entry([time.current_time, n_comps / self.survey_speed * self.labor])
             else:
@@ -81,23 +81,13 @@ class SiteMonitor(DetectionMethod):
         n_scores = len(site_inds)
         if n_scores == 0:
             return site_inds
-        probs = np.zeros(n_scores)
-        counter = 0
-        for site_ind in site_inds:
-            vals = np.zeros([1, len(self.detection_variables)])
-            ind = 0
-            for v, im in self.detection_variables.items():
-                if v in gas_field.met:
-                    vals[0, ind] = gas_field.get_met(time, v, interp_modes=im, ophrs=self.ophrs)[v]
-                else:
-                    # sum all emission variables needed for detection
-                    vals[0, ind] = np.sum(emissions[v][emissions.site_index == site_ind])
-                ind += 1
-            ttd = self.empirical_interpolator(self.time_to_detect_points, self.time_to_detect_days, vals)
-            probs[counter] = self.prob_detection(time, ttd)
-            counter += 1
-        scores = np.random.uniform(0, 1, n_scores)
-        detect = np.array(site_inds)[scores <= probs]
+        # a single array of site indexes is shared by the condition lookup and the final selection
+        site_inds = np.asarray(site_inds)
+        vals = self.get_site_conditions(time, gas_field, emissions, site_inds)
+        ttds = self.empirical_interpolator(self.time_to_detect_points, self.time_to_detect_days, vals)
+        probs = np.array([self.prob_detection(time, ttd) for ttd in ttds])
+        scores = self.draw_scores(n_scores)
+        detect = site_inds[scores <= probs]
         return detect
 
     def detect(self, time, gas_field, emissions):
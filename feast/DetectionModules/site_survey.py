@@ -2,7 +2,7 @@
 The site_survey module defines the site level level survey based detection class, SiteSurvey.
 """
 import numpy as np
-from .abstract_detection_method import DetectionMethod
+from .abstract_detection_method import DetectionMethod, EmpiricalInterpolator
 
 
 class SiteSurvey(DetectionMethod):
@@ -55,11 +55,13 @@ class SiteSurvey(DetectionMethod):
         self.site_queue = site_queue or []  # queue of sites to survey
         self.detection_probability_points = np.array(detection_probability_points)
         self.detection_probabilities = np.array(detection_probabilities)
+        self.pod_interpolator = EmpiricalInterpolator(self.detection_probability_points, self.detection_probabilities)
 
         # -------------- Set calculated parameters --------------
         work_time = (self.ophrs['end'] - self.ophrs['begin']) / 24
-        self.sites_per_timestep = int(self.sites_per_day * (int(time.delta_t) +
-                                                            np.min([1, np.mod(time.delta_t, 1) / work_time])))
+        # Whole days in a timestep allow a full day of work. The remainder allows at most one more working day.
+        whole_days, partial_day = divmod(time.delta_t, 1)
+        self.sites_per_timestep = int(self.sites_per_day * (whole_days + min(1, partial_day / work_time)))
         if self.sites_per_timestep < 1 and self.sites_per_day > 0:
             print("WARNING: expecting less than 1 site surveyed per timestep. May lead to unexpected behavior.")
 
@@ -80,24 +82,12 @@ class SiteSurvey(DetectionMethod):
         n_scores = len(site_inds)
         if n_scores == 0:
             return site_inds
-        probs = np.zeros(n_scores)
-        counter = 0
-        for site_ind in site_inds:
-            vals = np.zeros(len(self.detection_variables))
-            ind = 0
-            cond = emissions.index[emissions.site_index == site_ind].to_list()
-            for v, im in self.detection_variables.items():
-                if v in gas_field.met:
-                    vals[ind] = gas_field.get_met(time, v, interp_modes=im, ophrs=self.ophrs)[v]
-                else:
-                    # sum all emission variables needed for detection
-                    vals[ind] = np.sum(emissions[v][cond])
-                ind += 1
-            prob = self.empirical_interpolator(self.detection_probability_points, self.detection_probabilities, vals)
-            probs[counter] = prob
-            counter += 1
-        scores = np.random.uniform(0, 1, n_scores)
-        detect = np.array(site_inds)[scores <= probs]
+        # a single array of site indexes is shared by the condition lookup and the final selection
+        site_inds = np.asarray(site_inds)
+        vals = self.get_site_conditions(time, gas_field, emissions, site_inds)
+        probs = self.pod_interpolator(vals)
+        scores = self.draw_scores(n_scores)
+        detect = site_inds[scores <= probs]
         return detect
 
     def sites_surveyed(self, gas_field, time):
@@ -109,7 +99,7 @@ class SiteSurvey(DetectionMethod):
         :param time:
         :return site_inds: the indexes of sites to be surveyed during this timestep.
         """
-        n_sites = np.min([self.sites_per_timestep, len(self.site_queue)])
+        n_sites = min(self.sites_per_timestep, len(self.site_queue))
         # Determines the sites to survey based on operating envelope
         site_inds = self.choose_sites(gas_field, time, n_sites)
         self.deployment_count.append_entry([time.current_time, len(site_inds)])
@@ -41,13 +41,15 @@ class Emission:
                 end_time = np.array(end_time)
         except TypeError:
             end_time = np.ones(length_in) * end_time
+        # Every property is stored as a typed column. Indexes are kept as integers so that concatenated emissions
+        # (including the empty Emission objects used to initialize a GasField) do not promote them to floats.
         self.emissions = pd.DataFrame({
-            'flux': np.array(flux),
-            'site_index': np.array(site_index),
-            'comp_index': np.array(comp_index),
+            'flux': np.array(flux, dtype=float),
+            'site_index': np.array(site_index, dtype=int),
+            'comp_index': np.array(comp_index, dtype=int),
             'reparable': rep_array,
             'end_time': end_time,
-            'repair_cost': np.array(repair_cost),
+            'repair_cost': np.array(repair_cost, dtype=float),
             'start_time': np.array(start_time)
         }, index=np.array(emission_id))
         self.emissions.index.name = 'emission_id'
@@ -118,15 +120,14 @@ def bootstrap_emission_maker(n_em_in, comp_name, site, time, start_time=None, re
     leak_params = comp.emission_params
     detection_methods = list(leak_params.leak_sizes.keys())
     flux = []
-    round_err, leaks_per_well, counter = [], [], -1
+    round_err, leaks_per_well = [], []
     # Calculate leaks per well identified with each detection method stored in leak_params
     for method in detection_methods:
         n_leaks = len(leak_params.leak_sizes[method])
         n_wells = leak_params.well_counts[method]
         leaks_per_well.append(n_leaks/n_wells)
     # Generate the appropriate number of leaks from the distribution associated with each detection method
-    for method in detection_methods:
-        counter += 1
+    for counter, method in enumerate(detection_methods):
         n_leaks_key = leaks_per_well[counter] / sum(leaks_per_well) * n_em_in
         flux.extend(np.random.choice(leak_params.leak_sizes[method], int(n_leaks_key)))
         round_err.append(n_leaks_key % 1)
@@ -238,8 +238,8 @@ class GasField:
                 met_conds[parameter_name] = self.met[parameter_name][hour_index]
             else:
                 hr = np.mod(hour_index, 24)
-                start_index = hour_index - hr + int(np.max([hr, ophrs['begin']]))
-                end_index = hour_index - hr + int(np.min([hr + time.delta_t * 24, hour_index + ophrs['end']]))
+                start_index = hour_index - hr + int(max(hr, ophrs['begin']))
+                end_index = hour_index - hr + int(min(hr + time.delta_t * 24, hour_index + ophrs['end']))
                 relevant_metdat = self.met[parameter_name][start_index:end_index]
                 if interp_mode.lower() == 'mean':
                     met_conds[parameter_name] = np.mean(relevant_metdat)
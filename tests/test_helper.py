@@ -1,9 +1,24 @@
+import copy
+from functools import lru_cache
 import numpy as np
+from scipy.special import erf
 import feast
 import feast.EmissionSimModules.infrastructure_classes
 
 
 def basic_gas_field():
+    """
+    returns a copy of a basic gas field for testing purposes. The gas field is only built once, and the numpy random
+    state is reset to its state after the build so that tests behave as if the gas field was rebuilt.
+    :return:
+    """
+    gas_field, random_state = _basic_gas_field_template()
+    np.random.set_state(random_state)
+    return copy.deepcopy(gas_field)
+
+
+@lru_cache(maxsize=1)
+def _basic_gas_field_template():
     np.random.seed(0)
     n_sites = 100
     n_em = 100
@@ -40,7 +55,7 @@ def basic_gas_field():
                                                            len(gas_field.emissions.emissions.flux), dtype=int))
     gas_field.emissions.extend(initial_leaks)
 
-    return gas_field
+    return gas_field, np.random.get_state()
 
 
 def ex_prob_detect_arrays():
@@ -50,10 +65,6 @@ def ex_prob_detect_arrays():
     """
     x = np.array([0.01, 0.05, 0.1, 0.5, 1, 5])
     y = np.linspace(1, 10, 10)
-    x, y = np.meshgrid(x, y)
-    x = np.ndarray.flatten(x)
-    y = np.ndarray.flatten(y)
-    xy = np.transpose(np.array([x, y]))
-    prob_detect = (0.5 + 0.5 * np.array([np.math.erf((xy[ind, 0] - 0.7) / (1 * np.sqrt(2))) for ind
-                                         in range(xy.shape[0])])) * (11 - y) / 10
+    xy = np.stack(np.broadcast_arrays(x[None, :], y[:, None]), axis=-1).reshape(-1, 2)
+    prob_detect = (0.5 + 0.5 * erf((xy[:, 0] - 0.7) / (1 * np.sqrt(2)))) * (11 - xy[:, 1]) / 10
     return xy, prob_detect
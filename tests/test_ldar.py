@@ -213,6 +213,33 @@ def test_site_survey():
         raise ValueError("sites_surveyed not identifying the correct sites")
 
 
+def test_draw_scores():
+    time = sc.Time(delta_t=1, end_time=10, current_time=0)
+    tech_kwargs = {
+        'survey_interval': 50,
+        'sites_per_day': 100,
+        'ophrs': {'begin': 8, 'end': 17},
+        'site_cost': 100,
+        'dispatch_object': None,
+        'detection_probability_points': [1, 2],
+        'detection_probabilities': [0, 1]
+    }
+    tech_1 = Dm.site_survey.SiteSurvey(time, seed=10, **tech_kwargs)
+    tech_2 = Dm.site_survey.SiteSurvey(time, seed=10, **tech_kwargs)
+    np.random.seed(0)
+    scores_1 = tech_1.draw_scores(10)
+    np.random.seed(1)
+    scores_2 = tech_2.draw_scores(10)
+    if np.any(scores_1 != scores_2) or np.any((scores_1 < 0) | (scores_1 >= 1)):
+        raise ValueError("draw_scores is not reproducible when a seed is specified")
+    tech_3 = Dm.site_survey.SiteSurvey(time, **tech_kwargs)
+    np.random.seed(0)
+    scores_3 = tech_3.draw_scores(10)
+    np.random.seed(0)
+    if np.any(scores_3 != np.random.uniform(0, 1, 10)):
+        raise ValueError("draw_scores is not using the global random state when no seed is specified")
+
+
 def test_sitedetect_sites_surveyed():
     gas_field = basic_gas_field()
     gas_field.met_data_path = 'ExampleData/TMY-DataExample.csv'
@@ -485,6 +512,37 @@ def test_get_current_conditions():
         raise ValueError("get_current_conditions not returning the correct values")
 
 
+def test_get_site_conditions():
+    gas_field = basic_gas_field()
+    gas_field.met_data_path = 'ExampleData/TMY-DataExample.csv'
+    time = sc.Time(delta_t=1, end_time=10, current_time=0)
+    gas_field.met_data_maker()
+    prob_points, detect_probs = ex_prob_detect_arrays()
+    tech = Dm.site_survey.SiteSurvey(
+        time,
+        survey_interval=50,
+        sites_per_day=100,
+        ophrs={'begin': 8, 'end': 17},
+        site_cost=100,
+        dispatch_object=None,
+        detection_variables={'flux': 'mean', 'wind speed': 'mean'},
+        detection_probability_points=prob_points,
+        detection_probabilities=detect_probs
+    )
+    emissions = pd.DataFrame(gas_field.emissions.get_current_emissions(time))
+    emissions.loc[:, 'flux'] = np.linspace(0.1, 10, len(emissions))
+    site_inds = np.array([99, 0, 2, 5, 0, 42])
+    ret = tech.get_site_conditions(time, gas_field, emissions, site_inds)
+    expected = [np.sum(emissions.flux[emissions.site_index == site_ind]) for site_ind in site_inds]
+    if np.any(np.abs(ret[:, 0] - expected) > 1e-10):
+        raise ValueError("get_site_conditions not summing emissions at each site correctly")
+    ret_sorted = tech.get_site_conditions(time, gas_field, emissions.sort_values('site_index'), site_inds)
+    if np.any(np.abs(ret_sorted[:, 0] - expected) > 1e-10):
+        raise ValueError("get_site_conditions not summing site-sorted emissions correctly")
+    if np.any(ret[:, 1] != np.mean(gas_field.met['wind speed'][8:17])):
+        raise ValueError("get_site_conditions not returning the correct met conditions")
+
+
 def test_empirical_interpolator():
     time = sc.Time(delta_t=1, end_time=10, current_time=0)
     rep = Dm.repair.Repair(repair_delay=0)
@@ -513,6 +571,11 @@ def test_empirical_interpolator():
                                         np.array([0.01, 1.5]))
     if not tech.detection_probabilities[0] >= probs[0] >= tech.detection_probabilities[6]:
         raise ValueError("empirical_interpolator is not interpolating correctly")
+    # prob_points form a regular grid, so the center of a grid cell is the mean of its corners
+    probs = tech.empirical_interpolator(tech.detection_probability_points, tech.detection_probabilities,
+                                        np.array([[0.03, 1.5]]))
+    if np.abs(probs[0] - np.mean(tech.detection_probabilities[[0, 1, 6, 7]])) > 1e-10:
+        raise ValueError("empirical_interpolator is not interpolating regular grids correctly")
 
 
 def test_choose_sites():
@@ -680,12 +743,14 @@ def test_detect_quantification():
 test_comp_survey()
 test_check_time()
 test_site_survey()
+test_draw_scores()
 test_ldar_program()
 test_scenario_run()
 test_check_op_envelope()
 test_sitedetect_sites_surveyed()
 test_comp_survey_emitters_surveyed()
 test_get_current_conditions()
+test_get_site_conditions()
 test_empirical_interpolator()
 test_choose_sites()
 test_site_monitor()'''